@@ -1,17 +1,83 @@
+import os
 import re
-from typing import Tuple, Optional
+from typing import Iterable, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 
-def load_data(path: str) -> pd.DataFrame:
+# Columns the pipeline actually uses; identifiers such as PassengerId, Ticket
+# and Cabin are dropped by `clean_data` anyway, so they are not parsed at all.
+TITANIC_USECOLS = (
+    "Survived",
+    "Pclass",
+    "Name",
+    "Sex",
+    "Age",
+    "SibSp",
+    "Parch",
+    "Fare",
+    "Embarked",
+)
+
+# Compact dtypes for the Titanic schema (keys missing from a file are ignored).
+# Integer columns are left to the reader so blank cells load as missing;
+# `clean_data` downcasts them once they are known to be complete.
+TITANIC_DTYPES = {
+    "Age": "float32",
+    "Fare": "float32",
+    "Sex": "category",
+    "Embarked": "category",
+}
+
+
+# Identifier columns dropped before modelling, and the label columns that are
+# one-hot encoded (in output order)
+_ID_COLS = ("PassengerId", "Ticket", "Cabin")
+_CAT_COLS = ("Sex", "Embarked", "Title")
+
+
+def load_data(
+    path,
+    usecols: Optional[Iterable[str]] = None,
+    dtype: Optional[dict] = None,
+) -> pd.DataFrame:
     """Load CSV data from the given path into a DataFrame.
 
-    This is a thin wrapper around `pd.read_csv` kept for compatibility with
-    the rest of the project (and tests). It will raise the same errors as
+    This is a wrapper around `pd.read_csv` kept for compatibility with the
+    rest of the project (and tests); `path` may be anything `pd.read_csv`
+    accepts (path, URL or file-like object). It will raise the same errors as
     pandas when the file is not found or is malformed.
+
+    By default only the columns in `TITANIC_USECOLS` that exist in the file
+    are read, using the compact `TITANIC_DTYPES`. Pass `usecols`/`dtype` to
+    override either.
+
+    Local files are read with the multithreaded pyarrow CSV reader (with
+    arrow-backed columns) when pyarrow is installed; otherwise, and for URLs
+    and buffers, pandas' C engine is used.
     """
-    return pd.read_csv(path)
+    if dtype is None:
+        dtype = TITANIC_DTYPES
+    if usecols is None:
+        # a predicate rather than the list itself, so absent columns (e.g. no target) are tolerated
+        usecols = TITANIC_USECOLS.__contains__
+    if callable(usecols):
+        if not (isinstance(path, (str, os.PathLike)) and os.path.isfile(path)):
+            # buffers can only be read once (and URLs shouldn't be fetched
+            # twice), so use the C engine, which accepts callable usecols
+            return pd.read_csv(path, usecols=usecols, dtype=dtype, engine="c")
+        # pyarrow only accepts an explicit column list, so resolve it from the header
+        header = pd.read_csv(path, nrows=0).columns
+        usecols = [c for c in header if usecols(c)]
+    try:
+        return pd.read_csv(path, usecols=usecols, dtype=dtype, engine="pyarrow", dtype_backend="pyarrow")
+    except ImportError:
+        return pd.read_csv(path, usecols=usecols, dtype=dtype, engine="c")
+
+
+# Title between the surname comma and the first period, e.g. "Braund, Mr. Owen"
+_TITLE_RE = re.compile(r",\s*([^\.]+)\.")
 
 
 def _extract_title(name: str) -> str:
@@ -21,13 +87,149 @@ def _extract_title(name: str) -> str:
     """
     if not isinstance(name, str):
         return "Unknown"
-    m = re.search(r",\s*([^\.]+)\.", name)
+    m = _TITLE_RE.search(name)
     if m:
         return m.group(1).strip()
     return "Unknown"
 
 
-def clean_data(df: pd.DataFrame) -> pd.DataFrame:
+def _one_hot_block(s: pd.Series, drop_first: bool = True) -> pd.DataFrame:
+    """One-hot encode a single Series into a uint8 DataFrame named `<col>_<value>`.
+
+    The column is factorized (sorted, like `get_dummies`) and its indicator
+    matrix is filled in a single preallocated block by scattering ones at the
+    category codes. Missing values get an all-zero row.
+    """
+    n = len(s)
+    codes, uniques = pd.factorize(s, sort=True)
+    offset = 1 if drop_first else 0
+    mat = np.zeros((n, max(len(uniques) - offset, 0)), dtype=np.uint8)
+    mask = codes >= offset
+    mat[np.arange(n)[mask], codes[mask] - offset] = 1
+    names = [f"{s.name}_{v}" for v in uniques[offset:]]
+    return pd.DataFrame(mat, index=s.index, columns=names)
+
+
+def _one_hot(df: pd.DataFrame, columns: list, drop_first: bool = True) -> pd.DataFrame:
+    """One-hot encode `columns` of `df`, mirroring `pd.get_dummies`.
+
+    The encoded columns replace the originals and are appended at the end.
+    """
+    blocks = [_one_hot_block(df[col], drop_first=drop_first) for col in columns]
+    return pd.concat([df.drop(columns=columns)] + blocks, axis=1)
+
+
+def _with_category(s: pd.Series, value) -> pd.Series:
+    """Make sure a categorical Series can hold `value` (other dtypes pass through)."""
+    if isinstance(s.dtype, pd.CategoricalDtype) and value not in s.cat.categories:
+        s = s.cat.add_categories(value)
+    return s
+
+
+def _fill_label(s: pd.Series, value: str) -> pd.Series:
+    """Fill missing values of a label column, adding `value` as a category if needed."""
+    return _with_category(s, value).fillna(value)
+
+
+def _median_or_zero(s: pd.Series):
+    """The median of `s`, or 0 if it can't be computed."""
+    try:
+        return s.median()
+    except Exception:
+        return 0
+
+
+def _most_common(s: pd.Series):
+    """The most frequent value of `s` ('Missing' if all are missing)."""
+    # value_counts is a single hash-count pass; mode() also sorts the values
+    return s.value_counts(dropna=True).idxmax() if s.notna().any() else "Missing"
+
+
+def _downcast_count(s: pd.Series) -> pd.Series:
+    """Cast a complete, whole-valued count column to the smallest integer dtype that holds it.
+
+    Columns with gaps, fractional values or non-numeric data are returned
+    unchanged.
+    """
+    if not pd.api.types.is_numeric_dtype(s) or s.isna().any():
+        return s
+    return pd.to_numeric(s, downcast="integer")
+
+
+def _fill_values(df: pd.DataFrame) -> dict:
+    """Missing-value fills for the columns of `df` that get one.
+
+    Medians for Age and Fare (0 if they can't be computed), the most common
+    port for Embarked and 'missing' for Sex.
+    """
+    fill_map = {}
+    for c in ("Age", "Fare"):
+        if c in df.columns:
+            fill_map[c] = _median_or_zero(df[c])
+    if "Embarked" in df.columns:
+        fill_map["Embarked"] = _most_common(df["Embarked"])
+    if "Sex" in df.columns:
+        fill_map["Sex"] = "missing"
+    return fill_map
+
+
+def _downcast(col: str, s: pd.Series) -> pd.Series:
+    """Compact dtype for a filled column: 4-byte floats, category codes, small ints.
+
+    Non-numeric Age/Fare are left for `_to_numeric`/`encode_features` to coerce.
+    """
+    if col in ("Age", "Fare"):
+        return s.astype("float32") if pd.api.types.is_numeric_dtype(s) else s
+    if col in ("Embarked", "Sex"):
+        return s.astype("category")
+    if col in ("Pclass", "SibSp", "Parch"):
+        return _downcast_count(s)
+    return s
+
+
+def _titles(names: pd.Series) -> pd.Series:
+    """Vectorized `_extract_title` over a Series of names, as a category named `Title`."""
+    titles = names.astype("string").str.extract(_TITLE_RE, expand=False)
+    return titles.str.strip().fillna("Unknown").astype("category").rename("Title")
+
+
+def _to_numeric(s: pd.Series) -> pd.Series:
+    """Coerce leftover text columns to numbers (non-convertible -> NaN) and fill with 0."""
+    if pd.api.types.is_string_dtype(s.dtype) and not isinstance(s.dtype, pd.CategoricalDtype):
+        s = pd.to_numeric(s, errors="coerce")
+    return s.fillna(0)
+
+
+def _count(df: pd.DataFrame, col: str):
+    """`df[col]` with missing values as 0 (0 if absent), integers widened to int64.
+
+    `clean_data` may have downcast the counts to int8, where adding them
+    could wrap.
+    """
+    if col not in df.columns:
+        return 0
+    s = df[col].fillna(0)
+    return s.astype("int64") if pd.api.types.is_integer_dtype(s) else s
+
+
+def _engineered(df: pd.DataFrame):
+    """Compute `Title` and `(FamilySize, IsAlone)` for `engineer_features`."""
+
+    def family():
+        if "SibSp" in df.columns or "Parch" in df.columns:
+            family_size = _count(df, "SibSp") + _count(df, "Parch") + 1
+            return family_size, (family_size == 1).astype("int8")
+        return 1, 1
+
+    # vectorized; `_extract_title` is the scalar equivalent
+    if "Name" in df.columns:
+        title = _titles(df["Name"])
+    else:
+        title = pd.Series(pd.Categorical(["Unknown"] * len(df)), index=df.index, name="Title")
+    return title, family()
+
+
+def clean_data(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
     """Perform common Titanic dataset cleaning operations.
 
     Operations performed (best-effort; safe to run on minimal synthetic
@@ -36,112 +238,132 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     - Fill categorical missing values with mode or 'Missing'
     - Drop columns that are generally not useful for this simple model
       (PassengerId, Ticket, Cabin) if they exist
+
+    Pass `copy=False` to modify `df` in place when chaining the steps on a
+    frame you already own.
     """
-    df = df.copy()
+    if copy:
+        df = df.copy()
 
     # Drop obvious identifiers that won't help a generic model
-    for c in ("PassengerId", "Ticket", "Cabin"):
-        if c in df.columns:
-            df.drop(columns=[c], inplace=True)
-
-    # Age and Fare: numeric fills
-    if "Age" in df.columns:
-        try:
-            age_med = df["Age"].median()
-            df["Age"] = df["Age"].fillna(age_med)
-        except Exception:
-            df["Age"] = df["Age"].fillna(0)
-
-    if "Fare" in df.columns:
-        try:
-            fare_med = df["Fare"].median()
-            df["Fare"] = df["Fare"].fillna(fare_med)
-        except Exception:
-            df["Fare"] = df["Fare"].fillna(0)
-
-    # Embarked and Sex: categorical fills
-    if "Embarked" in df.columns:
-        df["Embarked"] = df["Embarked"].fillna(df["Embarked"].mode().iloc[0] if not df["Embarked"].mode().empty else "Missing")
+    df.drop(columns=list(_ID_COLS), inplace=True, errors="ignore")
 
-    if "Sex" in df.columns:
-        df["Sex"] = df["Sex"].fillna("missing")
+    # Missing values, applied together in a single fillna
+    fill_map = _fill_values(df)
+    for c in ("Embarked", "Sex"):
+        if c in fill_map:
+            df[c] = _with_category(df[c], fill_map[c])
+    df.fillna(fill_map, inplace=True)
+
+    # Downcast to compact dtypes
+    for c in ("Age", "Fare", "Embarked", "Sex", "Pclass", "SibSp", "Parch"):
+        if c in df.columns:
+            df[c] = _downcast(c, df[c])
 
     return df
 
 
-def engineer_features(df: pd.DataFrame) -> pd.DataFrame:
+def engineer_features(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
     """Add simple engineered features commonly used for Titanic models.
 
     - Extract `Title` from `Name` (if present)
     - Create `IsAlone` from `SibSp` and `Parch`
     - Optionally create `FamilySize`
-    """
-    df = df.copy()
 
-    # Title
-    if "Name" in df.columns:
-        df["Title"] = df["Name"].apply(_extract_title)
-    else:
-        df["Title"] = "Unknown"
-
-    # IsAlone and FamilySize
-    if "SibSp" in df.columns or "Parch" in df.columns:
-        sibsp = df["SibSp"] if "SibSp" in df.columns else 0
-        parch = df["Parch"] if "Parch" in df.columns else 0
-        df["FamilySize"] = sibsp + parch + 1
-        df["IsAlone"] = (df["FamilySize"] == 1).astype(int)
-    else:
-        df["FamilySize"] = 1
-        df["IsAlone"] = 1
+    Pass `copy=False` to add the columns to `df` in place.
+    """
+    if copy:
+        df = df.copy()
 
+    df["Title"], (df["FamilySize"], df["IsAlone"]) = _engineered(df)
     return df
 
 
-def encode_features(df: pd.DataFrame, drop_name: bool = True) -> pd.DataFrame:
+def encode_features(df: pd.DataFrame, drop_name: bool = True, copy: bool = True) -> pd.DataFrame:
     """Encode categorical variables and drop unused columns.
 
     - Convert categorical variables to dummies (Sex, Embarked, Title)
     - Optionally drop the original `Name` column
     - Ensures numeric dtype for ML models
+
+    Pass `copy=False` to skip the defensive copy; note the result may still be
+    a new DataFrame since one-hot encoding builds new columns.
     """
-    df = df.copy()
+    if copy:
+        df = df.copy()
 
     # Columns we generally want to drop after feature extraction
-    for c in ("Name",):
-        if drop_name and c in df.columns:
-            df.drop(columns=[c], inplace=True)
+    if drop_name:
+        df.drop(columns=["Name"], inplace=True, errors="ignore")
 
     # Categorical columns that are safe to one-hot encode if present
-    cat_cols = [c for c in ("Sex", "Embarked", "Title") if c in df.columns]
+    cat_cols = [c for c in _CAT_COLS if c in df.columns]
     if cat_cols:
-        df = pd.get_dummies(df, columns=cat_cols, drop_first=True)
+        df = _one_hot(df, cat_cols, drop_first=True)
 
-    # Ensure numeric types where possible
-    for c in df.columns:
-        if df[c].dtype == object:
-            # try to coerce to numeric (non-convertible -> NaN); fillna below
-            df[c] = pd.to_numeric(df[c], errors="coerce")
+    # Ensure numeric types where possible: only leftover text columns need
+    # coercing (non-convertible -> NaN; fillna below)
+    text_cols = df.select_dtypes(include=["object", "string"]).columns
+    if len(text_cols):
+        df[text_cols] = df[text_cols].apply(pd.to_numeric, errors="coerce")
 
-    df = df.fillna(0)
+    df.fillna(0, inplace=True)
     return df
 
 
+def preprocess_fused(df: pd.DataFrame, target: Optional[str] = None) -> pd.DataFrame:
+    """Single-pass equivalent of `clean_data` -> `engineer_features` -> `encode_features`.
+
+    Each input column is read once and its final form (filled, downcast,
+    encoded) computed directly; the output frame is assembled in one concat
+    instead of being rewritten by every step. `df` is not modified. The
+    result matches `encode_features(engineer_features(clean_data(df)))`
+    column for column (with `target`, if given, moved last).
+    """
+    fill_map = _fill_values(df)
+    title, (family_size, is_alone) = _engineered(df)
+    engineered = {"FamilySize": family_size, "IsAlone": is_alone}
+
+    out = {}
+    labels = {"Title": title}
+    for c in df.columns:
+        if c in _ID_COLS or c in ("Name", "Title"):
+            continue
+        if c in engineered:
+            # recomputed, but keeps its position like `engineer_features`
+            out[c] = engineered.pop(c)
+            continue
+        s = df[c]
+        if c in fill_map:
+            s = _fill_label(s, fill_map[c])
+        s = _downcast(c, s)
+        if c in _CAT_COLS:
+            labels[c] = s
+        else:
+            out[c] = _to_numeric(s)
+    out.update(engineered)
+
+    blocks = [_one_hot_block(labels[c]) for c in _CAT_COLS if c in labels]
+    result = pd.concat([pd.DataFrame(out, index=df.index)] + blocks, axis=1)
+
+    if target and target in result.columns:
+        # ensure target stays as the last column for readability (not required)
+        cols = [c for c in result.columns if c != target] + [target]
+        result = result[cols]
+    return result
+
+
 def preprocess(df: pd.DataFrame, target: Optional[str] = None) -> pd.DataFrame:
-    """Full preprocessing pipeline applied in order.
+    """Full preprocessing pipeline: cleaning, feature engineering and encoding.
 
     If `target` is provided, the target column will be left intact in the
     returned DataFrame (i.e., preprocessing is applied only to feature columns).
+
+    Runs the fused single-pass implementation, `preprocess_fused`. The
+    individual steps remain available on their own and share its fill,
+    downcast and feature helpers, so both paths give the same result.
     """
-    df = df.copy()
-    df = clean_data(df)
-    df = engineer_features(df)
-    df = encode_features(df)
-    # keep target column if present and requested
-    if target and target in df.columns:
-        # ensure target stays as the last column for readability (not required)
-        cols = [c for c in df.columns if c != target] + [target]
-        df = df[cols]
-    return df
+    return preprocess_fused(df, target=target)
 
 
 def split_features_target(df: pd.DataFrame, target: str = "Survived") -> Tuple[pd.DataFrame, pd.Series]:
@@ -158,11 +380,14 @@ def split_features_target(df: pd.DataFrame, target: str = "Survived") -> Tuple[p
 
 
 __all__ = [
+    "TITANIC_USECOLS",
+    "TITANIC_DTYPES",
     "load_data",
     "clean_data",
     "engineer_features",
     "encode_features",
     "preprocess",
+    "preprocess_fused",
     "split_features_target",
 ]
 
@@ -1,41 +1,157 @@
+import copy
+import hashlib
+import pickle
+
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
 from sklearn.linear_model import LogisticRegression
-from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score
+from sklearn.pipeline import Pipeline, make_pipeline
+from sklearn.preprocessing import FunctionTransformer, OneHotEncoder
 import joblib
+import numpy as np
 import pandas as pd
 
+from .data import engineer_features
+
+
+def _to_labels(X: pd.DataFrame) -> pd.DataFrame:
+    """Cast categorical feature columns to string labels for OneHotEncoder.
+
+    OneHotEncoder rejects `pd.NA` and columns mixing strings and numbers, so
+    missing values become their own 'missing' label and every value is cast
+    to str.
+    """
+    X = X.astype(object)
+    return X.where(X.notna(), "missing").astype(str)
+
+
+def build_preprocessor(X: pd.DataFrame) -> ColumnTransformer:
+    """Build (unfitted) preprocessing for the feature columns of `X`.
+
+    Numeric columns pass through with missing values filled with 0; all other
+    columns are one-hot encoded (first level dropped) into a sparse float32
+    matrix, which LogisticRegression consumes directly. Categories unseen
+    during fitting encode as all zeros.
+    """
+    num_cols = X.select_dtypes(include=["number", "bool"]).columns.tolist()
+    cat_cols = [c for c in X.columns if c not in num_cols]
+    return ColumnTransformer(
+        [
+            ("num", SimpleImputer(strategy="constant", fill_value=0), num_cols),
+            (
+                "cat",
+                make_pipeline(
+                    FunctionTransformer(_to_labels, feature_names_out="one-to-one"),
+                    OneHotEncoder(drop="first", sparse_output=True, dtype=np.float32, handle_unknown="ignore"),
+                ),
+                cat_cols,
+            ),
+        ],
+        sparse_threshold=1.0,
+    )
+
+
+def _add_features(X: pd.DataFrame) -> pd.DataFrame:
+    """Add `Title`/`FamilySize`/`IsAlone` and drop the raw `Name`.
+
+    Row-wise and stateless, so it gives the same result at train and predict
+    time; one-hot encoding the free-text `Name` would only produce one unseen
+    category per new passenger.
+    """
+    return engineer_features(X).drop(columns=["Name"], errors="ignore")
 
-def _simple_preprocess(X: pd.DataFrame) -> pd.DataFrame:
-    """A minimal preprocessing step: fillna and get dummies for categorical features.
+
+def _simple_preprocess(X: pd.DataFrame):
+    """A minimal preprocessing step: engineered features, then `build_preprocessor`.
+
+    Returns (fitted_preprocessor, transformed_X), the latter a sparse float32
+    matrix (numeric columns would otherwise upcast it to float64). The fitted
+    preprocessor is a Pipeline that reproduces the same columns, in the same
+    order, for any new frame with the raw feature columns.
     Replace with more robust preprocessing for real experiments.
     """
-    X = X.copy()
-    X = X.fillna(0)
-    X = pd.get_dummies(X, drop_first=True)
-    return X
+    features = FunctionTransformer(_add_features).fit(X)
+    Xf = features.transform(X)
+    encode = build_preprocessor(Xf)
+    Xt = encode.fit_transform(Xf).astype(np.float32, copy=False)
+    return Pipeline([("features", features), ("encode", encode)]), Xt
+
+
+# Fitted preprocessors and their output keyed by (columns, dtypes, content hash) of the raw
+# features, so repeated `train` calls (e.g. a grid search) skip the rework
+_PREPROC_CACHE: dict = {}
+_PREPROC_CACHE_SIZE = 8
+
+
+def _cached_preprocess(X: pd.DataFrame):
+    """Return `_simple_preprocess(X)`, reusing the result for identical inputs."""
+    # digest the per-row hashes in order: a sum would match any row permutation
+    # and hand back a matrix misaligned with the caller's labels
+    row_hashes = pd.util.hash_pandas_object(X, index=True).to_numpy()
+    key = (tuple(X.columns), tuple(X.dtypes.astype(str)), hashlib.blake2b(row_hashes.tobytes()).hexdigest())
+    cached = _PREPROC_CACHE.get(key)
+    if cached is None:
+        cached = _simple_preprocess(X)
+        if len(_PREPROC_CACHE) >= _PREPROC_CACHE_SIZE:
+            _PREPROC_CACHE.pop(next(iter(_PREPROC_CACHE)))
+        _PREPROC_CACHE[key] = cached
+    return cached
+
+
+def _holdout_indices(n: int, test_size: float, random_state: int):
+    """Shuffled (train_idx, test_idx) row indices for a single holdout split.
+
+    Slicing the preprocessed matrix once with these replaces
+    `train_test_split`, which copies every input into train/test pieces.
+    As there, `test_size` is a fraction of rows, rounded up.
+    """
+    idx = np.random.default_rng(random_state).permutation(n)
+    n_test = int(np.ceil(test_size * n))
+    if not 0 < n_test < n:
+        raise ValueError(f"test_size={test_size} leaves an empty train or test split for {n} rows")
+    return idx[n_test:], idx[:n_test]
 
 
 def train(df: pd.DataFrame, target: str = "Survived", test_size: float = 0.2, random_state: int = 42):
     """Train a simple logistic regression model.
 
-    Returns (model, accuracy_on_holdout, X_test, y_test)
+    Returns (model, accuracy_on_holdout, X_test, y_test). `model` is a
+    Pipeline of the fitted preprocessor and classifier, so it predicts
+    directly on raw feature frames; `X_test` is the preprocessed holdout and
+    `y_test` a numpy array.
     """
     if target not in df.columns:
         raise ValueError(f"Target column '{target}' not found in DataFrame")
     X = df.drop(columns=[target])
     y = df[target]
-    X = _simple_preprocess(X)
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state)
-    model = LogisticRegression(max_iter=1000)
-    model.fit(X_train, y_train)
-    preds = model.predict(X_test)
+    pre, X = _cached_preprocess(X)
+    train_idx, test_idx = _holdout_indices(len(y), test_size, random_state)
+    y = y.to_numpy()
+    X_train, X_test = X[train_idx], X[test_idx]
+    y_train, y_test = y[train_idx], y[test_idx]
+    # lbfgs keeps float32 input as float32; the looser tol trades a little
+    # precision for fewer iterations
+    clf = LogisticRegression(solver="lbfgs", max_iter=1000, tol=1e-3)
+    clf.fit(X_train, y_train)
+    preds = clf.predict(X_test)
     acc = accuracy_score(y_test, preds)
+    # the cached preprocessor is shared; give each model its own copy
+    model = Pipeline([("pre", copy.deepcopy(pre)), ("lr", clf)])
     return model, acc, X_test, y_test
 
 
 def save_model(model, path: str):
-    joblib.dump(model, path)
+    """Persist a model returned by `train`.
+
+    The model is the whole Pipeline, so the fitted preprocessing (engineered
+    features and category encoding) is stored with the classifier and
+    prediction needs no separate encoding step.
+    """
+    # uncompressed so `load_model` can memory-map the numpy arrays
+    joblib.dump(model, path, compress=0, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def load_model(path: str):
-    return joblib.load(path)
+    # arrays are mapped read-only from the page cache rather than copied
+    return joblib.load(path, mmap_mode="r")
@@ -7,18 +7,19 @@ python -m src.predict --predict data/new.csv --model models/model.joblib --out p
 import argparse
 import os
 import pandas as pd
-from .data import load_data
+from .data import TITANIC_DTYPES, load_data
 from .model import train, save_model, load_model
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Train or predict with a simple Titanic model")
     parser.add_argument("--train", help="Path to training CSV (contains target column 'Survived')")
     parser.add_argument("--save", help="Where to save trained model")
     parser.add_argument("--model", help="Path to saved model for prediction")
     parser.add_argument("--predict", help="Path to CSV to run predictions on (no target column expected)")
     parser.add_argument("--out", help="Output CSV path for predictions")
-    args = parser.parse_args()
+    parser.add_argument("--chunksize", type=int, default=50_000, help="Rows scored per batch when predicting")
+    args = parser.parse_args(argv)
 
     if args.train:
         df = load_data(args.train)
@@ -33,19 +34,18 @@ def main():
         if not args.model:
             raise SystemExit("--model is required for prediction")
         model = load_model(args.model)
-        df = load_data(args.predict)
-        # minimal preprocessing to match train: rely on model expecting same columns
-        # for now, use model.predict on raw/dummified features
-        X = pd.get_dummies(df, drop_first=True).fillna(0)
-        preds = model.predict(X)
-        out_df = df.copy()
-        out_df["prediction"] = preds
-        if args.out:
-            os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
-            out_df.to_csv(args.out, index=False)
-            print(f"Wrote predictions to {args.out}")
-        else:
-            print(out_df.head())
+        # stream the file in batches so memory stays bounded; the model
+        # pipeline applies the preprocessing fitted at train time
+        with pd.read_csv(args.predict, dtype=TITANIC_DTYPES, chunksize=args.chunksize) as reader:
+            if args.out:
+                os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+                with open(args.out, "w", newline="") as out:
+                    for i, chunk in enumerate(reader):
+                        chunk.assign(prediction=model.predict(chunk)).to_csv(out, header=(i == 0), index=False)
+                print(f"Wrote predictions to {args.out}")
+            else:
+                chunk = next(reader)
+                print(chunk.assign(prediction=model.predict(chunk)).head())
 
 
 if __name__ == "__main__":
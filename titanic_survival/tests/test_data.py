@@ -0,0 +1,148 @@
+import io
+import os
+import pandas as pd
+import pytest
+from src.data import load_data, clean_data, engineer_features, encode_features, preprocess, preprocess_fused, _extract_title, _one_hot
+
+
+def test_engineer_features_title_matches_scalar_extraction():
+    names = ['Braund, Mr. Owen Harris', 'Rothes, the Countess. of (Lucy)', 'no title here', None]
+    df = pd.DataFrame({'Name': names, 'SibSp': [1, 0, 0, 0], 'Parch': [0, 0, 2, 0]})
+    out = engineer_features(df)
+    assert list(out['Title']) == [_extract_title(n) for n in names]
+    assert list(out['Title']) == ['Mr', 'the Countess', 'Unknown', 'Unknown']
+
+
+def test_preprocess_does_not_mutate_input():
+    df = pd.DataFrame({
+        'PassengerId': [1, 2],
+        'Name': ['Braund, Mr. Owen Harris', 'Cumings, Mrs. John'],
+        'Age': [22.0, None],
+        'Sex': ['male', 'female'],
+        'Survived': [0, 1],
+    })
+    before = df.copy()
+    out = preprocess(df, target='Survived')
+    pd.testing.assert_frame_equal(df, before)
+    assert 'PassengerId' not in out.columns
+    assert out.columns[-1] == 'Survived'
+
+
+def test_one_hot_matches_get_dummies():
+    df = pd.DataFrame({
+        'Age': [22.0, 38.0, 26.0, 35.0],
+        'Sex': ['male', 'female', 'female', 'male'],
+        'Embarked': ['S', None, 'Q', 'C'],
+    })
+    out = _one_hot(df, ['Sex', 'Embarked'])
+    expected = pd.get_dummies(df, columns=['Sex', 'Embarked'], drop_first=True)
+    assert list(out.columns) == list(expected.columns)
+    assert (out.astype(float).values == expected.astype(float).values).all()
+
+
+def test_load_data_reads_only_titanic_columns(tmp_path):
+    path = tmp_path / 'new.csv'
+    path.write_text(
+        'PassengerId,Pclass,Name,Sex,Age,Ticket,Fare,Cabin\n'
+        '1,3,"Braund, Mr. Owen Harris",male,22,A/5 21171,7.25,\n'
+    )
+    df = load_data(str(path))
+    assert list(df.columns) == ['Pclass', 'Name', 'Sex', 'Age', 'Fare']
+    assert df['Age'].dtype == 'float32'
+
+
+def test_load_data_keeps_blank_integer_cells_as_missing(tmp_path):
+    path = tmp_path / 'gaps.csv'
+    path.write_text('Pclass,SibSp,Age\n1,,3\n')
+    df = load_data(str(path))
+    assert df['SibSp'].isna().all()
+    assert df['Pclass'].tolist() == [1]
+
+
+def test_clean_data_downcasts_dtypes():
+    df = pd.DataFrame({
+        'Pclass': [1, 3],
+        'Age': [22.0, None],
+        'SibSp': [1, 0],
+        'Sex': ['male', None],
+        'Embarked': [None, 'S'],
+    })
+    out = clean_data(df)
+    assert out['Age'].dtype == 'float32'
+    assert out['Pclass'].dtype == 'int8'
+    assert out['SibSp'].dtype == 'int8'
+    assert out['Sex'].dtype == 'category'
+    assert list(out['Sex']) == ['male', 'missing']
+    assert list(out['Embarked']) == ['S', 'S']
+
+
+TITANIC_CSV = os.path.join(os.path.dirname(__file__), '..', 'data', 'Titanic-Dataset.csv')
+
+
+def _small_frame():
+    return pd.DataFrame({
+        'PassengerId': [1, 2, 3],
+        'Survived': [0, 1, 1],
+        'Pclass': [3, 1, 3],
+        'Name': ['Braund, Mr. Owen Harris', 'Cumings, Mrs. John', 'Heikkinen, Miss. Laina'],
+        'Sex': ['male', 'female', None],
+        'Age': [22.0, None, 26.0],
+        'SibSp': [1, 1, 0],
+        'Parch': [0, 0, 0],
+        'Fare': [7.25, 71.28, None],
+        'Embarked': ['S', 'C', None],
+    })
+
+
+@pytest.mark.parametrize('make_df', [
+    _small_frame,
+    lambda: _small_frame().assign(Title=['x', 'y', 'z'], FamilySize=[9, 9, 9]),
+    lambda: _small_frame().assign(Age=['x', None, '3'], SibSp=[1.5, None, 200]),
+    lambda: load_data(TITANIC_CSV),
+    lambda: pd.read_csv(TITANIC_CSV),
+])
+def test_preprocess_fused_matches_step_by_step_pipeline(make_df):
+    df = make_df()
+    steps = encode_features(engineer_features(clean_data(df)))
+    steps = steps[[c for c in steps.columns if c != 'Survived'] + ['Survived']]
+    pd.testing.assert_frame_equal(preprocess_fused(df, target='Survived'), steps)
+
+
+def test_encode_features_coerces_leftover_text_columns():
+    df = pd.DataFrame({'Deck': ['1', 'x', None], 'Age': [1.0, 2.0, 3.0]})
+    out = encode_features(df)
+    assert out['Deck'].tolist() == [1.0, 0.0, 0.0]
+    assert preprocess_fused(df)['Deck'].tolist() == [1.0, 0.0, 0.0]
+
+
+def test_load_data_accepts_file_like_input():
+    buf = io.StringIO('PassengerId,Pclass,Age\n1,3,22\n')
+    df = load_data(buf)
+    assert list(df.columns) == ['Pclass', 'Age']
+
+
+def test_clean_data_downcast_keeps_count_values():
+    out = clean_data(pd.DataFrame({'SibSp': [200, 1], 'Parch': [1.5, 0.0]}))
+    assert out['SibSp'].tolist() == [200, 1]
+    assert out['Parch'].tolist() == [1.5, 0.0]
+
+
+def test_preprocess_tolerates_non_numeric_age():
+    df = pd.DataFrame({'Age': ['x', None, '3'], 'Fare': [1.0, None, 3.0]})
+    assert clean_data(df)['Fare'].dtype == 'float32'
+    out = preprocess(df)
+    assert out['Age'].tolist() == [0.0, 0.0, 3.0]
+    pd.testing.assert_frame_equal(out, encode_features(engineer_features(clean_data(df))))
+
+
+def test_engineer_features_family_size_does_not_wrap():
+    out = engineer_features(pd.DataFrame({'SibSp': [200, 1.0], 'Parch': [0, 0]}))
+    assert out['FamilySize'].tolist() == [201, 2]
+    out = engineer_features(pd.DataFrame({'SibSp': [1.5, None]}))
+    assert out['FamilySize'].tolist() == [2.5, 1.0]
+    assert out['IsAlone'].tolist() == [0, 1]
+
+
+def test_preprocess_family_size_after_count_downcast():
+    df = pd.DataFrame({'SibSp': [100, 0], 'Parch': [100, 0]})
+    assert engineer_features(clean_data(df))['FamilySize'].tolist() == [201, 1]
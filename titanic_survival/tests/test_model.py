@@ -1,5 +1,6 @@
 import pandas as pd
-from src.model import train
+from src import model as model_mod
+from src.model import train, save_model, load_model, _holdout_indices
 
 
 def test_train_returns_model_and_accuracy():
@@ -14,3 +15,94 @@ def test_train_returns_model_and_accuracy():
     model, acc, X_test, y_test = train(df, test_size=0.5)
     assert hasattr(model, 'predict')
     assert 0.0 <= acc <= 1.0
+
+
+def test_train_reuses_cached_preprocessing(monkeypatch):
+    df = pd.DataFrame({
+        'Pclass': [1, 3, 2, 3],
+        'Sex': ['male', 'female', 'female', 'male'],
+        'Survived': [0, 1, 1, 0]
+    })
+    calls = []
+    original = model_mod._simple_preprocess
+    monkeypatch.setattr(model_mod, '_PREPROC_CACHE', {})
+    monkeypatch.setattr(model_mod, '_simple_preprocess', lambda X: calls.append(1) or original(X))
+    train(df, test_size=0.5)
+    train(df, test_size=0.5, random_state=0)
+    assert len(calls) == 1
+
+
+def test_trained_model_predicts_on_raw_features():
+    df = pd.DataFrame({
+        'Pclass': [1, 3, 2, 3],
+        'Age': [22, None, 26, 35],
+        'Sex': ['male', 'female', 'female', 'male'],
+        'Embarked': ['S', 'C', None, 'S'],
+        'Survived': [0, 1, 1, 0]
+    })
+    model, _, _, _ = train(df, test_size=0.5)
+    new = pd.DataFrame({'Pclass': [2], 'Age': [float('nan')], 'Sex': ['female'], 'Embarked': ['Q']})
+    assert model.predict(new).shape == (1,)
+
+
+def test_saved_model_round_trips(tmp_path):
+    df = pd.DataFrame({
+        'Pclass': [1, 3, 2, 3],
+        'Age': [22, 38, 26, 35],
+        'Sex': ['male', 'female', 'female', 'male'],
+        'Survived': [0, 1, 1, 0]
+    })
+    model, _, _, _ = train(df, test_size=0.5)
+    path = tmp_path / 'model.joblib'
+    save_model(model, str(path))
+    loaded = load_model(str(path))
+    X = df.drop(columns=['Survived'])
+    assert (loaded.predict(X) == model.predict(X)).all()
+
+
+def test_holdout_indices_partition_rows():
+    train_idx, test_idx = _holdout_indices(10, 0.25, random_state=0)
+    assert len(test_idx) == 3
+    assert sorted(list(train_idx) + list(test_idx)) == list(range(10))
+
+
+def test_model_encodes_prediction_batches_with_training_schema():
+    df = pd.DataFrame({
+        'Pclass': [1, 3, 2, 3],
+        'Name': ['Braund, Mr. Owen', 'Cumings, Mrs. John', 'Heikkinen, Miss. Laina', 'Allen, Mr. William'],
+        'Sex': ['male', 'female', 'female', 'male'],
+        'Embarked': ['S', 'C', 'Q', 'S'],
+        'Survived': [0, 1, 1, 0]
+    })
+    model, _, X_test, _ = train(df, test_size=0.5)
+    # a batch containing only some of the training categories
+    batch = pd.DataFrame({'Pclass': [3], 'Name': ['Smith, Mr. John'], 'Sex': ['male'], 'Embarked': ['S']})
+    assert model.named_steps['pre'].transform(batch).shape[1] == X_test.shape[1]
+    assert model.predict(batch).shape == (1,)
+
+
+def test_train_cache_distinguishes_row_order(monkeypatch):
+    df = pd.DataFrame({
+        'Pclass': [1, 3, 2, 3, 1, 2],
+        'Sex': ['male', 'female', 'female', 'male', 'female', 'male'],
+        'Survived': [0, 1, 1, 0, 1, 0]
+    })
+    monkeypatch.setattr(model_mod, '_PREPROC_CACHE', {})
+    train(df, test_size=0.5)
+    shuffled = df.sample(frac=1, random_state=1)
+    _, _, X_test, y_test = train(shuffled, test_size=0.5)
+    monkeypatch.setattr(model_mod, '_PREPROC_CACHE', {})
+    _, _, X_cold, y_cold = train(shuffled, test_size=0.5)
+    assert (X_test != X_cold).nnz == 0
+    assert (y_test == y_cold).all()
+    assert len(model_mod._PREPROC_CACHE) == 1
+
+
+def test_train_accepts_numeric_categorical_with_gaps():
+    df = pd.DataFrame({
+        'Pclass': pd.Categorical([1, 3, None, 3]),
+        'Age': [22, 38, 26, 35],
+        'Survived': [0, 1, 1, 0]
+    })
+    model, _, _, _ = train(df, test_size=0.5)
+    assert model.predict(df.drop(columns=['Survived'])).shape == (4,)
@@ -0,0 +1,29 @@
+import pandas as pd
+from src.predict import main
+
+
+def test_predict_streams_batches_to_csv(tmp_path):
+    train_csv = tmp_path / 'train.csv'
+    pd.DataFrame({
+        'PassengerId': [1, 2, 3, 4],
+        'Pclass': [1, 3, 2, 3],
+        'Sex': ['male', 'female', 'female', 'male'],
+        'Age': [22, 38, 26, 35],
+        'Survived': [0, 1, 1, 0],
+    }).to_csv(train_csv, index=False)
+    new_csv = tmp_path / 'new.csv'
+    pd.DataFrame({
+        'PassengerId': [5, 6, 7],
+        'Pclass': [1, 2, 3],
+        'Sex': ['female', 'male', 'female'],
+        'Age': [30, None, 4],
+    }).to_csv(new_csv, index=False)
+    model_path = tmp_path / 'model.joblib'
+    out_path = tmp_path / 'preds.csv'
+
+    main(['--train', str(train_csv), '--save', str(model_path)])
+    main(['--predict', str(new_csv), '--model', str(model_path), '--out', str(out_path), '--chunksize', '2'])
+
+    out = pd.read_csv(out_path)
+    assert out['PassengerId'].tolist() == [5, 6, 7]
+    assert out['prediction'].isin([0, 1]).all()